@@ -2,6 +2,7 @@
 Browser detection and profile management for Chromium-based browsers.
 """
 
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -14,6 +15,11 @@ class BrowserProfile:
     path: Path
     sessions_path: Path
     preferences_path: Path
+    # Casefolded name for case-insensitive profile matching
+    _name_cf: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._name_cf = self.name.casefold()
 
     @property
     def exists(self) -> bool:
@@ -85,6 +91,16 @@ BROWSER_DEFINITIONS = [
 ]
 
 
+# Session file names: snapshot prefixes and legacy fixed names
+SESSION_FILE_PREFIXES = ("Session_", "Tabs_")
+SESSION_FILE_NAMES = frozenset({"Current Session", "Current Tabs"})
+
+
+def is_session_file_name(name: str) -> bool:
+    """Check whether a file name looks like a session file."""
+    return name.startswith(SESSION_FILE_PREFIXES) or name in SESSION_FILE_NAMES
+
+
 def get_config_base() -> Path:
     """Get the base config directory."""
     return Path.home() / ".config"
@@ -162,39 +178,42 @@ def detect_browsers(config_base: Path | None = None) -> list[Browser]:
 
 
 def get_browser_by_id(
-    browser_id: str, config_base: Path | None = None
+    browser_id: str,
+    config_base: Path | None = None,
+    browsers: list[Browser] | None = None,
 ) -> Browser | None:
-    """Get a specific browser by its ID."""
-    browsers = detect_browsers(config_base)
+    """
+    Get a specific browser by its ID.
+
+    Args:
+        browser_id: Short browser identifier (e.g. "vivaldi").
+        config_base: Base config directory to detect browsers in.
+        browsers: Already detected browsers to search instead of detecting them.
+    """
+    if browsers is None:
+        browsers = detect_browsers(config_base)
     for browser in browsers:
         if browser.id == browser_id:
             return browser
     return None
 
 
-def get_browser_choices() -> list[str]:
-    """Get list of available browser IDs for autocompletion."""
-    return [b.id for b in detect_browsers()]
-
-
-def get_profile_choices(browser_id: str) -> list[str]:
-    """Get list of profile names for a browser."""
-    browser = get_browser_by_id(browser_id)
-    if browser:
-        return [p.name for p in browser.profiles]
-    return []
-
-
 def find_latest_session(
     config_base: Path | None = None,
+    browsers: list[Browser] | None = None,
 ) -> tuple[Browser, BrowserProfile, Path] | None:
     """
     Find the most recently modified session file across all browsers and profiles.
 
+    Args:
+        config_base: Base config directory to detect browsers in.
+        browsers: Already detected browsers to search instead of detecting them.
+
     Returns:
         Tuple of (browser, profile, session_file) or None if no sessions found.
     """
-    browsers = detect_browsers(config_base)
+    if browsers is None:
+        browsers = detect_browsers(config_base)
     latest_session: tuple[Browser, BrowserProfile, Path, float] | None = None
 
     for browser in browsers:
@@ -202,27 +221,30 @@ def find_latest_session(
             if not profile.has_sessions:
                 continue
 
-            sessions_dir = profile.sessions_path
+            try:
+                with os.scandir(profile.sessions_path) as it:
+                    for entry in it:
+                        if not is_session_file_name(entry.name):
+                            continue
 
-            # Look for session files with common patterns
-            for pattern in [
-                "Session_*",
-                "Tabs_*",
-                "Current Session",
-                "Current Tabs",
-            ]:
-                for session_file in sessions_dir.glob(pattern):
-                    if not session_file.is_file():
-                        continue
-
-                    try:
-                        mtime = session_file.stat().st_mtime
+                        try:
+                            if not entry.is_file():
+                                continue
+                            mtime = entry.stat().st_mtime
+                        except OSError:
+                            # Skip files we can't stat
+                            continue
 
                         if latest_session is None or mtime > latest_session[3]:
-                            latest_session = (browser, profile, session_file, mtime)
-                    except OSError:
-                        # Skip files we can't stat
-                        continue
+                            latest_session = (
+                                browser,
+                                profile,
+                                Path(entry.path),
+                                mtime,
+                            )
+            except OSError:
+                # Skip sessions directories we can't read
+                continue
 
     if latest_session is None:
         return None
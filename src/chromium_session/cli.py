@@ -3,18 +3,19 @@ Typer CLI for Chromium Session Parser.
 """
 
 import csv
+import functools
 import json
+import os
 import shutil
 import sys
+from collections import Counter, defaultdict
+from contextlib import nullcontext
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Annotated, Optional
+from typing import TYPE_CHECKING, Annotated, Optional
 
 import typer
-from rich import print as rprint
-from rich.console import Console
-from rich.table import Table
-from rich.tree import Tree
 
 from .bookmarks import (
     Bookmark,
@@ -28,26 +29,125 @@ from .browsers import (
     detect_browsers,
     find_latest_session,
     get_browser_by_id,
-    get_browser_choices,
-    get_profile_choices,
+    is_session_file_name,
 )
 from .history import parse_history
 from .organizer import organize_tabs_by_domain, sort_tabs_by_title
 from .parser import SessionParser, load_vivaldi_workspaces
 from .writer import SessionWriter
 
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.tree import Tree
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 app = typer.Typer(
     name="chromium-session",
     help="Parse Chromium-based browser session files with workspace support.",
     no_args_is_help=True,
 )
-console = Console()
+
+
+# Rich is imported lazily so that --help and shell completion, which never
+# render tables or trees, don't pay its import cost on every invocation.
+@functools.cache
+def _console() -> "Console":
+    """Get the shared Rich console, creating it on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+@functools.cache
+def _err_console() -> "Console":
+    """Get the shared Rich console for stderr, creating it on first use."""
+    from rich.console import Console
+
+    return Console(stderr=True)
+
+
+def rprint(*objects, **kwargs) -> None:
+    """Print Rich markup to stdout."""
+    _console().print(*objects, **kwargs)
+
+
+def eprint(*objects, **kwargs) -> None:
+    """Print Rich markup to stderr, keeping each message on one line."""
+    _err_console().print(*objects, soft_wrap=True, **kwargs)
+
+
+def _json_default(obj):
+    """Serialize objects that provide a to_dict() method."""
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write encoded output to stdout in a single call."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # stdout replaced by a text-only stream (e.g. io.StringIO)
+        sys.stdout.write(data.decode("utf-8"))
+        sys.stdout.flush()
+        return
+    # Flush pending text first so it can't end up after the payload
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+
+def _dump_json(obj) -> None:
+    """Write obj to stdout as indented JSON, using orjson when available."""
+    if orjson is not None:
+        _write_stdout(
+            orjson.dumps(
+                obj,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2
+                | orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_APPEND_NEWLINE,
+            )
+        )
+    else:
+        # Match orjson's bytes: UTF-8 text, not \uXXXX escapes
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=_json_default)
+        _write_stdout((text + "\n").encode("utf-8"))
+
+
+def _write_json_line(obj) -> None:
+    """Write obj to stdout as a single compact JSON line (NDJSON)."""
+    if orjson is not None:
+        _write_stdout(
+            orjson.dumps(
+                obj,
+                default=_json_default,
+                option=orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+                | orjson.OPT_APPEND_NEWLINE,
+            )
+        )
+    else:
+        text = json.dumps(
+            obj, ensure_ascii=False, separators=(",", ":"), default=_json_default
+        )
+        _write_stdout((text + "\n").encode("utf-8"))
+
+
+@functools.cache
+def _cached_detect_browsers() -> list[Browser]:
+    """Detect browsers once per process and share the result between callers."""
+    return detect_browsers()
 
 
 def complete_browser(incomplete: str) -> list[str]:
     """Autocomplete browser names."""
-    choices = get_browser_choices()
-    return [c for c in choices if c.startswith(incomplete)]
+    return [b.id for b in _cached_detect_browsers() if b.id.startswith(incomplete)]
 
 
 def complete_profile(ctx: typer.Context, incomplete: str) -> list[str]:
@@ -55,8 +155,10 @@ def complete_profile(ctx: typer.Context, incomplete: str) -> list[str]:
     browser_id = ctx.params.get("browser")
     if not browser_id:
         return []
-    choices = get_profile_choices(browser_id)
-    return [c for c in choices if c.startswith(incomplete)]
+    browser = get_browser_by_id(browser_id, browsers=_cached_detect_browsers())
+    if not browser:
+        return []
+    return [p.name for p in browser.profiles if p.name.startswith(incomplete)]
 
 
 def get_selected_profile(
@@ -67,27 +169,29 @@ def get_selected_profile(
         return None
 
     if profile_name:
-        for p in browser.profiles:
-            if p.name == profile_name:
-                return p
+        by_name = {p.name: p for p in browser.profiles}
+        if profile_name in by_name:
+            return by_name[profile_name]
         # Try partial match
+        needle = profile_name.casefold()
         for p in browser.profiles:
-            if profile_name.lower() in p.name.lower():
+            if needle in p._name_cf:
                 return p
 
     # Return first profile with sessions, or just first
-    for p in browser.profiles:
-        if p.has_sessions:
-            return p
-    return browser.profiles[0]
+    return next((p for p in browser.profiles if p.has_sessions), browser.profiles[0])
 
 
 def list_session_files(sessions_dir: Path) -> list[Path]:
     """List all session files in a directory, sorted by modification time."""
-    files = []
-    for pattern in ["Session_*", "Tabs_*", "Current Session", "Current Tabs"]:
-        files.extend(sessions_dir.glob(pattern))
-    return sorted(files, key=lambda f: f.stat().st_mtime, reverse=True)
+    with os.scandir(sessions_dir) as it:
+        entries = [
+            (entry.stat().st_mtime, entry.path)
+            for entry in it
+            if is_session_file_name(entry.name) and entry.is_file()
+        ]
+    entries.sort(reverse=True)
+    return [Path(path) for _, path in entries]
 
 
 def export_to_csv(all_results: list[dict], show_deleted: bool = False):
@@ -144,7 +248,9 @@ def export_to_csv(all_results: list[dict], show_deleted: bool = False):
 @app.command("list")
 def list_browsers():
     """List all detected Chromium-based browsers."""
-    browsers = detect_browsers()
+    from rich.table import Table
+
+    browsers = _cached_detect_browsers()
 
     if not browsers:
         rprint("[yellow]No Chromium-based browsers detected[/yellow]")
@@ -166,7 +272,7 @@ def list_browsers():
 
         table.add_row(browser.id, browser.name, profile_names, sessions_str)
 
-    console.print(table)
+    _console().print(table)
 
 
 @app.command()
@@ -191,9 +297,12 @@ def workspaces(
     ] = False,
 ):
     """List defined workspaces (Vivaldi only)."""
+    from rich.markup import escape
+    from rich.table import Table
+
     # Auto-detect browser and profile if not specified
     if browser is None:
-        result = find_latest_session()
+        result = find_latest_session(browsers=_cached_detect_browsers())
         if result is None:
             rprint("[red]No session files found in any browser profile[/red]")
             rprint("[dim]Run 'chromium-session list' to see available browsers[/dim]")
@@ -205,7 +314,7 @@ def workspaces(
                 f"[dim]Auto-detected: {browser_obj.name} / {profile_obj.name}[/dim]\n"
             )
     else:
-        browser_obj = get_browser_by_id(browser)
+        browser_obj = get_browser_by_id(browser, browsers=_cached_detect_browsers())
         if not browser_obj:
             rprint(
                 f"[red]Browser '{browser}' not found. Run 'chromium-session list' to see available browsers.[/red]"
@@ -224,8 +333,7 @@ def workspaces(
         raise typer.Exit(1)
 
     if json_output:
-        data = {str(k): {"name": v.name, "emoji": v.emoji} for k, v in ws.items()}
-        print(json.dumps(data, indent=2))
+        _dump_json(ws)
         return
 
     table = Table(title=f"Workspaces in {browser_obj.name} / {profile_obj.name}")
@@ -234,9 +342,9 @@ def workspaces(
     table.add_column("ID", style="dim")
 
     for ws_id, workspace in sorted(ws.items(), key=lambda x: x[1].name):
-        table.add_row(workspace.emoji or "📁", workspace.name, str(ws_id))
+        table.add_row(workspace.emoji or "📁", escape(workspace.name), str(ws_id))
 
-    console.print(table)
+    _console().print(table)
 
 
 @app.command()
@@ -266,6 +374,12 @@ def parse(
     json_output: Annotated[
         bool, typer.Option("--json", "-j", help="Output as JSON")
     ] = False,
+    ndjson_output: Annotated[
+        bool,
+        typer.Option(
+            "--ndjson", help="Stream one JSON object per session file (NDJSON)"
+        ),
+    ] = False,
     csv_output: Annotated[
         bool, typer.Option("--csv", "-c", help="Output as CSV")
     ] = False,
@@ -279,25 +393,29 @@ def parse(
 ):
     """Parse session files and display tabs."""
     # Validate mutually exclusive flags
-    if json_output and csv_output:
-        rprint("[red]Error: --json and --csv flags are mutually exclusive[/red]")
+    if json_output + ndjson_output + csv_output > 1:
+        rprint(
+            "[red]Error: --json, --ndjson and --csv flags are mutually exclusive[/red]"
+        )
         raise typer.Exit(1)
 
+    rich_output = not (json_output or ndjson_output or csv_output)
+
     # Auto-detect browser and profile if not specified
     if browser is None:
-        result = find_latest_session()
+        result = find_latest_session(browsers=_cached_detect_browsers())
         if result is None:
             rprint("[red]No session files found in any browser profile[/red]")
             rprint("[dim]Run 'chromium-session list' to see available browsers[/dim]")
             raise typer.Exit(1)
 
         browser_obj, profile_obj, _ = result
-        if not json_output and not csv_output:
+        if rich_output:
             rprint(
                 f"[dim]Auto-detected: {browser_obj.name} / {profile_obj.name}[/dim]\n"
             )
     else:
-        browser_obj = get_browser_by_id(browser)
+        browser_obj = get_browser_by_id(browser, browsers=_cached_detect_browsers())
         if not browser_obj:
             rprint(
                 f"[red]Browser '{browser}' not found. Run 'chromium-session list' to see available browsers.[/red]"
@@ -324,39 +442,53 @@ def parse(
         rprint(f"[red]No session files found in {profile_obj.sessions_path}[/red]")
         raise typer.Exit(1)
 
+    # Same for every file, so build it once and share it between results
+    ws_serialized = {
+        ws_id: {"name": ws.name, "emoji": ws.emoji}
+        for ws_id, ws in workspaces_map.items()
+    }
     parser = SessionParser(workspaces=workspaces_map)
     all_results = []
 
-    for filepath in files_to_parse:
-        try:
-            result = parser.parse_file(filepath)
-            result["_file"] = str(filepath)
-            result["_mtime"] = filepath.stat().st_mtime
-            result["_browser"] = browser_obj.name
-            result["_profile"] = profile_obj.name
-            result["_workspaces"] = {
-                str(ws_id): {"name": ws.name, "emoji": ws.emoji}
-                for ws_id, ws in workspaces_map.items()
-            }
-            all_results.append(result)
-
-            if not json_output and not csv_output:
-                rprint(
-                    f"\n[bold cyan]# {browser_obj.name} / {profile_obj.name}[/bold cyan]"
-                )
-                rprint(f"[dim]# File: {filepath.name}[/dim]")
-                display_result(
-                    result,
-                    show_deleted=show_deleted,
-                    by_workspace=by_workspace,
-                )
+    # Hold Rich output in the console buffer and write it out once at the end,
+    # rather than flushing the terminal for every header and tree
+    with _console() if rich_output else nullcontext():
+        for filepath in files_to_parse:
+            try:
+                result = parser.parse_file(filepath)
+                result["_file"] = str(filepath)
+                result["_mtime"] = filepath.stat().st_mtime
+                result["_browser"] = browser_obj.name
+                result["_profile"] = profile_obj.name
+                result["_workspaces"] = ws_serialized
+
+                if ndjson_output:
+                    # Emit each file as soon as it is parsed instead of buffering
+                    _write_json_line(result)
+                    continue
 
-        except Exception as e:
-            rprint(f"[red]Error parsing {filepath}: {e}[/red]")
+                all_results.append(result)
+
+                if rich_output:
+                    rprint(
+                        f"\n[bold cyan]# {browser_obj.name} / {profile_obj.name}[/bold cyan]"
+                    )
+                    rprint(f"[dim]# File: {filepath.name}[/dim]")
+                    display_result(
+                        result,
+                        show_deleted=show_deleted,
+                        by_workspace=by_workspace,
+                    )
+
+            except Exception as e:
+                # Keep machine-readable stdout clean: one record per line for
+                # --ndjson, a single document for --json, rows only for --csv
+                report = rprint if rich_output else eprint
+                report(f"[red]Error parsing {filepath}: {e}[/red]")
 
     if json_output:
         output = all_results if len(all_results) > 1 else all_results[0]
-        print(json.dumps(output, indent=2))
+        _dump_json(output)
     elif csv_output:
         export_to_csv(all_results, show_deleted=show_deleted)
 
@@ -380,9 +512,12 @@ def summary(
     ] = None,
 ):
     """Show a quick summary of session stats."""
+    from rich.markup import escape
+    from rich.table import Table
+
     # Auto-detect browser and profile if not specified
     if browser is None:
-        result = find_latest_session()
+        result = find_latest_session(browsers=_cached_detect_browsers())
         if result is None:
             rprint("[red]No session files found in any browser profile[/red]")
             rprint("[dim]Run 'chromium-session list' to see available browsers[/dim]")
@@ -391,7 +526,7 @@ def summary(
         browser_obj, profile_obj, _ = result
         rprint(f"[dim]Auto-detected: {browser_obj.name} / {profile_obj.name}[/dim]\n")
     else:
-        browser_obj = get_browser_by_id(browser)
+        browser_obj = get_browser_by_id(browser, browsers=_cached_detect_browsers())
         if not browser_obj:
             rprint(
                 f"[red]Browser '{browser}' not found. Run 'chromium-session list' to see available browsers.[/red]"
@@ -421,17 +556,10 @@ def summary(
         try:
             result = parser.parse_file(filepath)
 
-            total_tabs = 0
-            deleted_tabs = 0
-            ws_counts: dict[str, int] = {}
-
-            for window in result["windows"]:
-                for tab in window["tabs"]:
-                    total_tabs += 1
-                    if tab["deleted"]:
-                        deleted_tabs += 1
-                    ws_name = tab.get("workspace") or "No Workspace"
-                    ws_counts[ws_name] = ws_counts.get(ws_name, 0) + 1
+            tabs = list(chain.from_iterable(w["tabs"] for w in result["windows"]))
+            total_tabs = len(tabs)
+            deleted_tabs = sum(1 for t in tabs if t["deleted"])
+            ws_counts = Counter(t.get("workspace") or "No Workspace" for t in tabs)
 
             rprint(f"\n[bold cyan]{browser_obj.name} / {profile_obj.name}[/bold cyan]")
             rprint(f"[dim]Session: {filepath.name}[/dim]")
@@ -445,7 +573,7 @@ def summary(
             table.add_row("Deleted tabs", str(deleted_tabs))
             table.add_row("Windows", str(len(result["windows"])))
 
-            console.print(table)
+            _console().print(table)
 
             # Workspace breakdown (if any)
             if ws_counts and len(ws_counts) > 1:
@@ -453,10 +581,10 @@ def summary(
                 ws_table.add_column("Workspace", style="cyan")
                 ws_table.add_column("Tabs", style="green", justify="right")
 
-                for ws_name, count in sorted(ws_counts.items(), key=lambda x: -x[1]):
-                    ws_table.add_row(ws_name, str(count))
+                for ws_name, count in ws_counts.most_common():
+                    ws_table.add_row(escape(ws_name), str(count))
 
-                console.print(ws_table)
+                _console().print(ws_table)
 
         except Exception as e:
             rprint(f"[red]Error: {e}[/red]")
@@ -473,7 +601,9 @@ def profiles(
     ],
 ):
     """List profiles for a specific browser."""
-    browser_obj = get_browser_by_id(browser)
+    from rich.table import Table
+
+    browser_obj = get_browser_by_id(browser, browsers=_cached_detect_browsers())
     if not browser_obj:
         rprint(
             f"[red]Browser '{browser}' not found. Run 'chromium-session list' to see available browsers.[/red]"
@@ -489,7 +619,7 @@ def profiles(
         has_sessions = "✓" if p.has_sessions else "✗"
         table.add_row(p.name, has_sessions, str(p.path))
 
-    console.print(table)
+    _console().print(table)
 
 
 @app.command()
@@ -516,7 +646,7 @@ def bookmarks(
     """Display bookmarks with folder structure."""
     # Auto-detect browser and profile if not specified
     if browser is None:
-        result = find_latest_session()
+        result = find_latest_session(browsers=_cached_detect_browsers())
         if result is None:
             rprint("[red]No session files found in any browser profile[/red]")
             rprint("[dim]Run 'chromium-session list' to see available browsers[/dim]")
@@ -528,7 +658,7 @@ def bookmarks(
                 f"[dim]Auto-detected: {browser_obj.name} / {profile_obj.name}[/dim]\n"
             )
     else:
-        browser_obj = get_browser_by_id(browser)
+        browser_obj = get_browser_by_id(browser, browsers=_cached_detect_browsers())
         if not browser_obj:
             rprint(
                 f"[red]Browser '{browser}' not found. Run 'chromium-session list' to see available browsers.[/red]"
@@ -550,7 +680,7 @@ def bookmarks(
         bookmarks_data = parse_bookmarks_file(bookmarks_path)
 
         if json_output:
-            print(json.dumps(bookmarks_data.to_dict(), indent=2))
+            _dump_json(bookmarks_data.to_dict())
             return
 
         # Display bookmarks with Rich Tree
@@ -627,9 +757,12 @@ def history(
     ] = False,
 ):
     """Display browsing history."""
+    from rich.markup import escape
+    from rich.table import Table
+
     # Auto-detect browser and profile if not specified
     if browser is None:
-        result = find_latest_session()
+        result = find_latest_session(browsers=_cached_detect_browsers())
         if result is None:
             rprint("[red]No session files found in any browser profile[/red]")
             rprint("[dim]Run 'chromium-session list' to see available browsers[/dim]")
@@ -641,7 +774,7 @@ def history(
                 f"[dim]Auto-detected: {browser_obj.name} / {profile_obj.name}[/dim]\n"
             )
     else:
-        browser_obj = get_browser_by_id(browser)
+        browser_obj = get_browser_by_id(browser, browsers=_cached_detect_browsers())
         if not browser_obj:
             rprint(
                 f"[red]Browser '{browser}' not found. Run 'chromium-session list' to see available browsers.[/red]"
@@ -666,16 +799,15 @@ def history(
             raise typer.Exit(0)
 
         if json_output:
-            output = [entry.to_dict() for entry in entries]
-            print(json.dumps(output, indent=2))
+            _dump_json([entry.to_dict() for entry in entries])
             return
 
         # Display as table
         rprint(f"\n[bold cyan]{browser_obj.name} / {profile_obj.name}[/bold cyan]")
         if search:
-            rprint(f"[dim]Search: {search}[/dim]")
+            rprint(f"[dim]Search: {escape(search)}[/dim]")
         if domain:
-            rprint(f"[dim]Domain: {domain}[/dim]")
+            rprint(f"[dim]Domain: {escape(domain)}[/dim]")
 
         table = Table(title="Browsing History")
         table.add_column("Title", style="green", no_wrap=False, max_width=50)
@@ -695,14 +827,14 @@ def history(
             last_visit = entry.last_visit_time.strftime("%Y-%m-%d %H:%M")
 
             table.add_row(
-                title,
-                url,
-                entry.domain,
+                escape(title),
+                escape(url),
+                escape(entry.domain),
                 str(entry.visit_count),
                 last_visit,
             )
 
-        console.print(table)
+        _console().print(table)
         rprint(f"\n[dim]Showing {len(entries)} entries[/dim]")
 
     except FileNotFoundError as e:
@@ -713,24 +845,37 @@ def history(
         raise typer.Exit(1)
 
 
+# Above this many lines, tab listings are printed as plain text instead of a Tree
+_TREE_THRESHOLD = 200
+
+
+def _trunc(s: str, n: int = 60) -> str:
+    """Truncate s to n characters, marking the cut with an ellipsis."""
+    return s if len(s) <= n else s[:n] + "..."
+
+
 def display_bookmark_folder(
     folder: BookmarkFolder, title: str, bookmark_count: int, folder_count: int
 ):
     """Display a bookmark folder with its contents using Rich Tree."""
+    from rich.tree import Tree
+
     tree = Tree(
         f"[bold green]{title}[/bold green] ({bookmark_count} bookmarks, {folder_count} folders)"
     )
     _add_children_to_tree(tree, folder.children)
-    console.print(tree)
+    _console().print(tree)
 
 
 def _add_children_to_tree(
-    tree: Tree,
+    tree: "Tree",
     children: list[Bookmark | BookmarkFolder],
     depth: int = 0,
     max_depth: int = 10,
 ):
     """Recursively add bookmark children to tree."""
+    from rich.markup import escape
+
     if depth > max_depth:
         tree.add("[dim]... (max depth reached)[/dim]")
         return
@@ -738,12 +883,12 @@ def _add_children_to_tree(
     for child in children:
         if isinstance(child, Bookmark):
             # Display bookmark
-            name = child.name if child.name else "[untitled]"
-            url_preview = child.url[:60] + "..." if len(child.url) > 60 else child.url
+            name = escape(child.name or "[untitled]")
+            url_preview = escape(_trunc(child.url))
             tree.add(f"[cyan]{name}[/cyan] [dim]{url_preview}[/dim]")
         elif isinstance(child, BookmarkFolder):
             # Display folder
-            folder_name = child.name if child.name else "[untitled folder]"
+            folder_name = escape(child.name or "[untitled folder]")
             bookmark_count, folder_count = count_bookmarks(child)
             subtree = tree.add(
                 f"[bold yellow]📁 {folder_name}[/bold yellow] ({bookmark_count} bookmarks, {folder_count} folders)"
@@ -761,9 +906,26 @@ def display_result(
         display_by_window(result, show_deleted)
 
 
+def _tab_tree(label: str, lines: list[str]):
+    """Build a Rich tree of tab lines, or plain indented text for large ones."""
+    if len(lines) > _TREE_THRESHOLD:
+        # Tree nodes are costly to build and lay out; thousands of tabs in one
+        # window render much faster as a single pre-joined string.
+        return "\n".join([label, *(f"  {line}" for line in lines)])
+
+    from rich.tree import Tree
+
+    tree = Tree(label)
+    for line in lines:
+        tree.add(line)
+    return tree
+
+
 def display_by_workspace(result: dict, show_deleted: bool = False):
     """Display tabs grouped by workspace."""
-    workspaces: dict[str, list[dict]] = {}
+    from rich.markup import escape
+
+    workspaces: defaultdict[str, list[dict]] = defaultdict(list)
     no_workspace: list[dict] = []
 
     for window in result["windows"]:
@@ -774,37 +936,37 @@ def display_by_workspace(result: dict, show_deleted: bool = False):
             if ws_name == "No Workspace":
                 no_workspace.append(tab)
             else:
-                if ws_name not in workspaces:
-                    workspaces[ws_name] = []
                 workspaces[ws_name].append(tab)
 
     for ws_name, tabs in sorted(workspaces.items()):
-        tree = Tree(f"[bold green]📁 {ws_name}[/bold green] ({len(tabs)} tabs)")
-        for tab in tabs[:50]:
-            title = (
-                tab["title"][:60] + "..." if len(tab["title"]) > 60 else tab["title"]
-            )
-            tree.add(f"[dim]{title}[/dim]")
+        lines = [f"[dim]{escape(_trunc(tab['title']))}[/dim]" for tab in tabs[:50]]
         if len(tabs) > 50:
-            tree.add(f"[dim]... and {len(tabs) - 50} more[/dim]")
-        console.print(tree)
+            lines.append(f"[dim]... and {len(tabs) - 50} more[/dim]")
+        _console().print(
+            _tab_tree(
+                f"[bold green]📁 {escape(ws_name)}[/bold green] ({len(tabs)} tabs)",
+                lines,
+            )
+        )
 
     if no_workspace:
-        tree = Tree(
-            f"[bold yellow]📁 No Workspace[/bold yellow] ({len(no_workspace)} tabs)"
-        )
-        for tab in no_workspace[:20]:
-            title = (
-                tab["title"][:60] + "..." if len(tab["title"]) > 60 else tab["title"]
-            )
-            tree.add(f"[dim]{title}[/dim]")
+        lines = [
+            f"[dim]{escape(_trunc(tab['title']))}[/dim]" for tab in no_workspace[:20]
+        ]
         if len(no_workspace) > 20:
-            tree.add(f"[dim]... and {len(no_workspace) - 20} more[/dim]")
-        console.print(tree)
+            lines.append(f"[dim]... and {len(no_workspace) - 20} more[/dim]")
+        _console().print(
+            _tab_tree(
+                f"[bold yellow]📁 No Workspace[/bold yellow] ({len(no_workspace)} tabs)",
+                lines,
+            )
+        )
 
 
 def display_by_window(result: dict, show_deleted: bool = False):
     """Display tabs by window."""
+    from rich.markup import escape
+
     for i, window in enumerate(result["windows"]):
         if window["deleted"] and not show_deleted:
             continue
@@ -813,24 +975,27 @@ def display_by_window(result: dict, show_deleted: bool = False):
         if window["deleted"]:
             status = "🔴 DELETED"
 
-        tab_count = sum(1 for t in window["tabs"] if not t["deleted"] or show_deleted)
-
-        tree = Tree(f"[bold]Window {i + 1}[/bold] {status} ({tab_count} tabs)")
-
+        lines = []
         for tab in window["tabs"]:
             if tab["deleted"] and not show_deleted:
                 continue
 
-            title = (
-                tab["title"][:60] + "..." if len(tab["title"]) > 60 else tab["title"]
-            )
+            title = escape(_trunc(tab["title"]))
             prefix = "→ " if tab["active"] else "  "
-            ws = f" [cyan]📁{tab['workspace']}[/cyan]" if tab.get("workspace") else ""
+            ws = (
+                f" [cyan]📁{escape(tab['workspace'])}[/cyan]"
+                if tab.get("workspace")
+                else ""
+            )
             deleted = " [red][DELETED][/red]" if tab["deleted"] else ""
 
-            tree.add(f"{prefix}[dim]{title}[/dim]{ws}{deleted}")
+            lines.append(f"{prefix}[dim]{title}[/dim]{ws}{deleted}")
 
-        console.print(tree)
+        # One line per displayed tab, so the count needs no separate pass
+        tab_count = len(lines)
+        _console().print(
+            _tab_tree(f"[bold]Window {i + 1}[/bold] {status} ({tab_count} tabs)", lines)
+        )
 
 
 @app.command()
@@ -868,6 +1033,9 @@ def organize(
     ] = False,
 ):
     """Organize tabs in session file by domain or title."""
+    from rich.markup import escape
+    from rich.tree import Tree
+
     # Validate flags
     if not by_domain and not by_title:
         rprint(
@@ -881,7 +1049,7 @@ def organize(
 
     # Auto-detect browser and profile if not specified
     if browser is None:
-        result = find_latest_session()
+        result = find_latest_session(browsers=_cached_detect_browsers())
         if result is None:
             rprint("[red]No session files found in any browser profile[/red]")
             rprint("[dim]Run 'chromium-session list' to see available browsers[/dim]")
@@ -892,7 +1060,7 @@ def organize(
             session_file = detected_session
         rprint(f"[dim]Auto-detected: {browser_obj.name} / {profile_obj.name}[/dim]\n")
     else:
-        browser_obj = get_browser_by_id(browser)
+        browser_obj = get_browser_by_id(browser, browsers=_cached_detect_browsers())
         if not browser_obj:
             rprint(
                 f"[red]Browser '{browser}' not found. Run 'chromium-session list' to see available browsers.[/red]"
@@ -976,10 +1144,10 @@ def organize(
 
             domain = extract_domain(url)
 
-            title_display = title[:50] + "..." if len(title) > 50 else title
-            tree.add(f"[dim]{title_display}[/dim] [yellow]({domain})[/yellow]")
+            title_display = escape(_trunc(title, 50))
+            tree.add(f"[dim]{title_display}[/dim] [yellow]({escape(domain)})[/yellow]")
 
-        console.print(tree)
+        _console().print(tree)
 
     if dry_run:
         rprint("\n[yellow]Dry run - no changes written[/yellow]")
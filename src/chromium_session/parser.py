@@ -33,6 +33,10 @@ class Workspace:
     name: str
     emoji: str = ""
 
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON export."""
+        return {"name": self.name, "emoji": self.emoji}
+
 
 @dataclass
 class HistoryItem: